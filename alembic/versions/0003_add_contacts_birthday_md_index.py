@@ -0,0 +1,30 @@
+"""Add month/day expression index on contact birthdays.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2024-01-01 00:00:02.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create expression index used by the upcoming birthdays query."""
+    op.execute(
+        "CREATE INDEX ix_contacts_birthday_md ON contacts "
+        "(EXTRACT(MONTH FROM birthday), EXTRACT(DAY FROM birthday))"
+    )
+
+
+def downgrade() -> None:
+    """Drop the birthday month/day expression index."""
+    op.drop_index("ix_contacts_birthday_md", table_name="contacts")
@@ -0,0 +1,27 @@
+"""Add unique lower(email) index on contacts.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2024-01-01 00:00:03.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create functional index used by case-insensitive email lookups."""
+    op.execute("CREATE UNIQUE INDEX ix_contacts_email_lower ON contacts (lower(email))")
+
+
+def downgrade() -> None:
+    """Drop the lower(email) index."""
+    op.drop_index("ix_contacts_email_lower", table_name="contacts")
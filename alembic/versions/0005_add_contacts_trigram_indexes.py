@@ -0,0 +1,39 @@
+"""Add pg_trgm GIN indexes for contact search.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2024-01-01 00:00:04.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_COLUMNS = ("first_name", "last_name", "email")
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and create trigram indexes used by ILIKE searches."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in TRGM_COLUMNS:
+        op.create_index(
+            f"ix_contacts_{column}_trgm",
+            "contacts",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Drop trigram indexes (the pg_trgm extension is left installed)."""
+    for column in reversed(TRGM_COLUMNS):
+        op.drop_index(f"ix_contacts_{column}_trgm", table_name="contacts")
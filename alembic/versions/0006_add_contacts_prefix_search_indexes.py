@@ -0,0 +1,47 @@
+"""Add lower() pattern indexes for prefix contact search.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2024-01-01 00:00:05.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create lower(column) text_pattern_ops indexes for LIKE 'value%' searches.
+
+    The email index is rebuilt with text_pattern_ops so it serves both exact
+    lookups and prefix searches.
+    """
+    op.execute(
+        "CREATE INDEX ix_contacts_first_name_lower ON contacts "
+        "(lower(first_name) text_pattern_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_contacts_last_name_lower ON contacts "
+        "(lower(last_name) text_pattern_ops)"
+    )
+    op.drop_index("ix_contacts_email_lower", table_name="contacts")
+    op.execute(
+        "CREATE UNIQUE INDEX ix_contacts_email_lower ON contacts "
+        "(lower(email) text_pattern_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop prefix search indexes and restore the plain lower(email) index."""
+    op.drop_index("ix_contacts_email_lower", table_name="contacts")
+    op.execute("CREATE UNIQUE INDEX ix_contacts_email_lower ON contacts (lower(email))")
+    op.drop_index("ix_contacts_last_name_lower", table_name="contacts")
+    op.drop_index("ix_contacts_first_name_lower", table_name="contacts")
@@ -0,0 +1,36 @@
+"""Store contact emails lowercased.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2024-01-01 00:00:06.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Lowercase existing contact emails.
+
+    Lookups now compare against the plain email index, so stored values must
+    already be normalized. The unique lower(email) index guarantees this can't
+    create duplicates.
+    """
+    op.get_bind().execute(
+        sa.text("UPDATE contacts SET email = lower(email) WHERE email <> lower(email)")
+    )
+
+
+def downgrade() -> None:
+    """Original email casing can't be restored; nothing to do."""
+    pass
@@ -7,9 +7,7 @@ from typing import Any
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
-from app.core.config import get_settings
-
-settings = get_settings()
+from app.core.config import SETTINGS as settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -1,10 +1,24 @@
 # app/crud.py
 """CRUD operations for users and contacts - pure data access layer."""
 
+import calendar
+from collections.abc import Sequence
 from datetime import date, timedelta
-
-from sqlalchemy import func, or_, select
-from sqlalchemy.orm import Session
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    bindparam,
+    func,
+    insert,
+    or_,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from app.core.security import get_password_hash, verify_password
 from app.models import Contact, User
@@ -16,7 +30,7 @@ from app.schemas import ContactCreate, ContactUpdate, UserCreate
 # ============================================================================
 
 
-def create_user(session: Session, data: UserCreate) -> User:
+async def create_user(session: AsyncSession, data: UserCreate) -> User:
     """Create a new user with hashed password."""
     user = User(
         email=data.email.lower(),
@@ -26,25 +40,32 @@ def create_user(session: Session, data: UserCreate) -> User:
         is_verified=False,
     )
     session.add(user)
-    session.flush()
+    await session.flush()
     return user
 
 
-def get_user_by_id(session: Session, user_id: int) -> User | None:
+# Hot-path lookups are built once and executed with bound parameters
+_GET_USER_BY_ID_STMT = select(User).where(User.id == bindparam("user_id"))
+_GET_USER_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+
+
+async def get_user_by_id(session: AsyncSession, user_id: int) -> User | None:
     """Get a user by ID."""
-    stmt = select(User).where(User.id == user_id)
-    return session.execute(stmt).scalar_one_or_none()
+    result = await session.execute(_GET_USER_BY_ID_STMT, {"user_id": user_id})
+    return result.scalar_one_or_none()
 
 
-def get_user_by_email(session: Session, email: str) -> User | None:
-    """Get a user by email (case-insensitive)."""
-    stmt = select(User).where(func.lower(User.email) == func.lower(email))
-    return session.execute(stmt).scalar_one_or_none()
+async def get_user_by_email(session: AsyncSession, email: str) -> User | None:
+    """Get a user by email (case-insensitive; emails are stored lowercased)."""
+    result = await session.execute(_GET_USER_BY_EMAIL_STMT, {"email": email.lower()})
+    return result.scalar_one_or_none()
 
 
-def authenticate_user(session: Session, email: str, password: str) -> User | None:
+async def authenticate_user(
+    session: AsyncSession, email: str, password: str
+) -> User | None:
     """Authenticate a user by email and password."""
-    user = get_user_by_email(session, email)
+    user = await get_user_by_email(session, email)
     if not user:
         return None
     if not verify_password(password, user.hashed_password):
@@ -52,19 +73,21 @@ def authenticate_user(session: Session, email: str, password: str) -> User | Non
     return user
 
 
-def verify_user_email(session: Session, email: str) -> User | None:
+async def verify_user_email(session: AsyncSession, email: str) -> User | None:
     """Mark a user's email as verified."""
-    user = get_user_by_email(session, email)
+    user = await get_user_by_email(session, email)
     if user:
         user.is_verified = True
-        session.flush()
+        await session.flush()
     return user
 
 
-def update_user_avatar(session: Session, user: User, avatar_url: str) -> User:
+async def update_user_avatar(
+    session: AsyncSession, user: User, avatar_url: str
+) -> User:
     """Update user's avatar URL."""
     user.avatar_url = avatar_url
-    session.flush()
+    await session.flush()
     return user
 
 
@@ -73,36 +96,57 @@ def update_user_avatar(session: Session, user: User, avatar_url: str) -> User:
 # ============================================================================
 
 
-def create_contact(session: Session, data: ContactCreate, user_id: int) -> Contact:
+# Prebuilt statements for get_contact / get_contact_by_email
+_GET_CONTACT_STMT = select(Contact).where(
+    Contact.id == bindparam("contact_id"), Contact.user_id == bindparam("user_id")
+)
+_GET_CONTACT_BY_EMAIL_STMT = select(Contact).where(Contact.email == bindparam("email"))
+
+
+async def create_contact(
+    session: AsyncSession, data: ContactCreate, user_id: int
+) -> Contact:
     """Create a new contact for a specific user."""
-    contact = Contact(
-        first_name=data.first_name,
-        last_name=data.last_name,
-        email=data.email,
-        phone=data.phone,
-        birthday=data.birthday,
-        notes=data.notes,
-        user_id=user_id,
-    )
-    session.add(contact)
-    session.flush()
-    return contact
+    return (await create_contacts_bulk(session, [data], user_id))[0]
 
 
-def get_contact(session: Session, contact_id: int, user_id: int) -> Contact | None:
+async def create_contacts_bulk(
+    session: AsyncSession, data_list: Sequence[ContactCreate], user_id: int
+) -> Sequence[Contact]:
+    """
+    Create several contacts for a specific user in a single INSERT round-trip.
+
+    Uses a multi-row INSERT ... RETURNING, so the returned contacts are fully
+    loaded and in the same order as data_list. Emails are stored lowercased.
+    """
+    if not data_list:
+        return []
+    stmt = insert(Contact).returning(Contact, sort_by_parameter_order=True)
+    rows = [
+        {**data.model_dump(), "email": data.email.lower(), "user_id": user_id}
+        for data in data_list
+    ]
+    return (await session.scalars(stmt, rows)).all()
+
+
+async def get_contact(
+    session: AsyncSession, contact_id: int, user_id: int
+) -> Contact | None:
     """Get a contact by ID, scoped to a specific user."""
-    stmt = select(Contact).where(Contact.id == contact_id, Contact.user_id == user_id)
-    return session.execute(stmt).scalar_one_or_none()
+    result = await session.execute(
+        _GET_CONTACT_STMT, {"contact_id": contact_id, "user_id": user_id}
+    )
+    return result.scalar_one_or_none()
 
 
-def get_contact_by_email(session: Session, email: str) -> Contact | None:
-    """Get a contact by email (globally unique)."""
-    stmt = select(Contact).where(func.lower(Contact.email) == func.lower(email))
-    return session.execute(stmt).scalar_one_or_none()
+async def get_contact_by_email(session: AsyncSession, email: str) -> Contact | None:
+    """Get a contact by email (globally unique; emails are stored lowercased)."""
+    result = await session.execute(_GET_CONTACT_BY_EMAIL_STMT, {"email": email.lower()})
+    return result.scalar_one_or_none()
 
 
-def list_contacts(
-    session: Session,
+async def list_contacts(
+    session: AsyncSession,
     user_id: int,
     *,
     q: str | None = None,
@@ -111,74 +155,177 @@ def list_contacts(
     email: str | None = None,
     limit: int = 20,
     offset: int = 0,
-) -> tuple[list[Contact], int]:
+    after_id: int | None = None,
+    include_total: bool = True,
+    prefix: bool = False,
+) -> tuple[list[Contact], int | None]:
     """
     List contacts with optional filters and pagination, scoped to a specific user.
 
     Search behavior:
     - If 'q' is provided: searches first_name OR last_name OR email (OR semantics)
     - If individual fields are provided without 'q': uses AND semantics
-    - All searches are case-insensitive using ILIKE
+    - All searches are case-insensitive: ILIKE substring matches by default,
+      or lower(column) LIKE 'value%' when 'prefix' is True (btree-indexable)
+
+    Pagination:
+    - If 'after_id' is provided: keyset pagination, returns contacts with
+      id > after_id and 'offset' is ignored
+    - Otherwise: classic offset/limit pagination
 
     Returns:
-        Tuple of (contacts list, total count)
+        Tuple of (contacts list, total count or None if include_total is False)
     """
-    stmt = select(Contact).where(Contact.user_id == user_id)
-    count_stmt = select(func.count(Contact.id)).where(Contact.user_id == user_id)
-
-    # Build filter conditions
+    # Statements are cached per filter shape; request values go in as parameters
+    params: dict[str, Any] = {"user_id": user_id, "limit": limit}
     if q:
+        params["q"] = _search_pattern(q, prefix)
+    else:
+        for name, value in (
+            ("first_name", first_name),
+            ("last_name", last_name),
+            ("email", email),
+        ):
+            if value:
+                params[name] = _search_pattern(value, prefix)
+
+    # Attach the total to every row via count(*) OVER () so a single scan serves
+    # both the page and the count. Keyset requests can't use it, since the
+    # cursor predicate would narrow the window.
+    windowed = include_total and after_id is None
+    if after_id is not None:
+        params["after_id"] = after_id
+    else:
+        params["offset"] = offset
+
+    filter_key = _ContactFilterKey(
+        has_q=bool(q),
+        has_first_name=not q and bool(first_name),
+        has_last_name=not q and bool(last_name),
+        has_email=not q and bool(email),
+        prefix=prefix,
+    )
+    page_stmt = _contact_page_stmt(filter_key, windowed, after_id is not None)
+    rows = (await session.execute(page_stmt, params)).all()
+    contacts = [row[0] for row in rows]
+
+    total = None
+    if windowed and rows:
+        total = rows[0].total
+    elif include_total:
+        # Empty page (e.g. offset past the end) or keyset request: count separately
+        count_stmt = select(func.count()).select_from(
+            _contact_filter_stmt(filter_key).subquery()
+        )
+        total = (await session.execute(count_stmt, params)).scalar() or 0
+
+    return contacts, total
+
+
+class _ContactFilterKey(NamedTuple):
+    """Which search filters a contact listing uses (the cache key for its SQL)."""
+
+    has_q: bool
+    has_first_name: bool
+    has_last_name: bool
+    has_email: bool
+    prefix: bool
+
+
+@lru_cache(maxsize=64)
+def _contact_filter_stmt(key: _ContactFilterKey) -> Select[tuple[Contact]]:
+    """
+    Build the filtered contact query for a filter shape.
+
+    Search values are bound parameters named after the filter ('q',
+    'first_name', 'last_name', 'email'), scoped by the 'user_id' parameter.
+    """
+    stmt = select(Contact).where(Contact.user_id == bindparam("user_id"))
+
+    if key.has_q:
         # General search: OR semantics across first_name, last_name, email
-        search_pattern = f"%{q}%"
         or_conditions = or_(
-            Contact.first_name.ilike(search_pattern),
-            Contact.last_name.ilike(search_pattern),
-            Contact.email.ilike(search_pattern),
+            _search_condition(Contact.first_name, "q", key.prefix),
+            _search_condition(Contact.last_name, "q", key.prefix),
+            _search_condition(Contact.email, "q", key.prefix),
         )
         stmt = stmt.where(or_conditions)
-        count_stmt = count_stmt.where(or_conditions)
     else:
         # Individual field filters: AND semantics
         conditions = []
-        if first_name:
-            conditions.append(Contact.first_name.ilike(f"%{first_name}%"))
-        if last_name:
-            conditions.append(Contact.last_name.ilike(f"%{last_name}%"))
-        if email:
-            conditions.append(Contact.email.ilike(f"%{email}%"))
+        if key.has_first_name:
+            conditions.append(
+                _search_condition(Contact.first_name, "first_name", key.prefix)
+            )
+        if key.has_last_name:
+            conditions.append(
+                _search_condition(Contact.last_name, "last_name", key.prefix)
+            )
+        if key.has_email:
+            conditions.append(_search_condition(Contact.email, "email", key.prefix))
 
         if conditions:
-            for condition in conditions:
-                stmt = stmt.where(condition)
-                count_stmt = count_stmt.where(condition)
+            stmt = stmt.where(and_(*conditions))
+
+    return stmt
+
+
+@lru_cache(maxsize=256)
+def _contact_page_stmt(key: _ContactFilterKey, windowed: bool, keyset: bool) -> Select:
+    """
+    Build the paginated contact query for a filter shape.
 
-    # Get total count
-    total = session.execute(count_stmt).scalar() or 0
+    Adds count(*) OVER () as 'total' when windowed, and pages with the
+    'after_id' (keyset) or 'offset' parameter plus 'limit'.
+    """
+    stmt = _contact_filter_stmt(key)
+    if windowed:
+        stmt = stmt.add_columns(func.count().over().label("total"))
 
     # Apply pagination and ordering
-    stmt = stmt.order_by(Contact.id).offset(offset).limit(limit)
-    contacts = list(session.execute(stmt).scalars().all())
+    if keyset:
+        stmt = stmt.where(Contact.id > bindparam("after_id"))
+    else:
+        stmt = stmt.offset(bindparam("offset"))
+    return stmt.order_by(Contact.id).limit(bindparam("limit"))
+
+
+def _search_condition(
+    column: InstrumentedAttribute[str], param: str, prefix: bool
+) -> ColumnElement[bool]:
+    """Build a case-insensitive substring (or prefix) match against a bound pattern."""
+    if prefix:
+        return func.lower(column).like(bindparam(param))
+    return column.ilike(bindparam(param))
 
-    return contacts, total
 
+def _search_pattern(value: str, prefix: bool) -> str:
+    """Build the LIKE pattern matching _search_condition for a search value."""
+    if prefix:
+        return f"{value.lower()}%"
+    return f"%{value}%"
 
-def update_contact(session: Session, contact: Contact, data: ContactUpdate) -> Contact:
+
+async def update_contact(
+    session: AsyncSession, contact: Contact, data: ContactUpdate
+) -> Contact:
     """Update an existing contact with provided fields."""
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(contact, field, value)
-    session.flush()
+    for field in data.model_fields_set:
+        setattr(contact, field, getattr(data, field))
+    if "email" in data.model_fields_set and contact.email is not None:
+        contact.email = contact.email.lower()
+    await session.flush()
     return contact
 
 
-def delete_contact(session: Session, contact: Contact) -> None:
+async def delete_contact(session: AsyncSession, contact: Contact) -> None:
     """Delete a contact."""
-    session.delete(contact)
-    session.flush()
+    await session.delete(contact)
+    await session.flush()
 
 
-def upcoming_birthdays(
-    session: Session,
+async def upcoming_birthdays(
+    session: AsyncSession,
     user_id: int,
     days: int = 7,
     today: date | None = None,
@@ -208,43 +355,78 @@ def upcoming_birthdays(
 
     end_date = today + timedelta(days=days)
 
-    # Fetch user's contacts and filter in Python for accurate year rollover handling
-    stmt = select(Contact).where(Contact.user_id == user_id)
-    all_contacts = list(session.execute(stmt).scalars().all())
-
+    # Narrow candidates in SQL by (month, day) so only matching rows are fetched;
+    # the exact next-birthday date is then computed in Python for ordering
+    month = func.extract("month", Contact.birthday)
+    day = func.extract("day", Contact.birthday)
+    window = or_(
+        *(
+            and_(month == m, day.between(first_day, last_day))
+            for m, first_day, last_day in _birthday_window(today, end_date)
+        )
+    )
+    stmt = select(Contact).where(Contact.user_id == user_id, window)
+    # Stream candidates in batches instead of materializing them all up front
+    candidates = await session.stream_scalars(stmt.execution_options(yield_per=1000))
+
+    # Compare next birthdays as ordinals; _get_next_birthday_md is memoized, so
+    # contacts sharing a birthday cost a single computation
+    today_ord = today.toordinal()
+    end_ord = end_date.toordinal()
     result = []
-    for contact in all_contacts:
-        next_bday = _get_next_birthday(contact.birthday, today)
-        if today <= next_bday <= end_date:
-            result.append((next_bday, contact))
+    async for contact in candidates:
+        birthday = contact.birthday
+        next_ord = _get_next_birthday_md(
+            birthday.month, birthday.day, today.year, today_ord
+        )
+        if today_ord <= next_ord <= end_ord:
+            result.append((next_ord, contact))
 
     # Sort by next birthday date
     result.sort(key=lambda x: x[0])
     return [contact for _, contact in result]
 
 
-def _get_next_birthday(birthday: date, reference_date: date) -> date:
+def _birthday_window(start: date, end: date) -> list[tuple[int, int, int]]:
     """
-    Calculate the next occurrence of a birthday relative to reference_date.
+    Split the date range start..end into (month, first_day, last_day) segments.
 
-    Handles leap year edge case: Feb 29 birthdays become Feb 28 on non-leap years.
+    A range crossing the year end yields separate segments for each side.
+    When a segment ends on Feb 28 of a non-leap year, day 29 is included so
+    Feb 29 birthdays (celebrated on Feb 28) are matched.
     """
-    this_year = reference_date.year
-
-    # Try to create birthday this year
-    try:
-        bday_this_year = birthday.replace(year=this_year)
-    except ValueError:
-        # Feb 29 on non-leap year -> use Feb 28
-        bday_this_year = date(this_year, 2, 28)
+    segments = []
+    current = start
+    while current <= end:
+        days_in_month = calendar.monthrange(current.year, current.month)[1]
+        segment_end = min(end, date(current.year, current.month, days_in_month))
+        last_day = segment_end.day
+        if current.month == 2 and last_day == 28 and not calendar.isleap(current.year):
+            last_day = 29
+        segments.append((current.month, current.day, last_day))
+        current = segment_end + timedelta(days=1)
+    return segments
+
+
+@lru_cache(maxsize=512)
+def _get_next_birthday_md(month: int, day: int, year: int, ref_ordinal: int) -> int:
+    """
+    Calculate the next occurrence of a month/day birthday as a date ordinal.
 
-    if bday_this_year >= reference_date:
+    year is the year of the reference date and ref_ordinal its toordinal().
+    Handles leap year edge case: Feb 29 birthdays become Feb 28 on non-leap years.
+    """
+    bday_this_year = date(year, *_observed_birthday(month, day, year)).toordinal()
+    if bday_this_year >= ref_ordinal:
         return bday_this_year
 
     # Birthday already passed this year, use next year
-    next_year = this_year + 1
-    try:
-        return birthday.replace(year=next_year)
-    except ValueError:
-        # Feb 29 on non-leap year -> use Feb 28
-        return date(next_year, 2, 28)
+    next_year = year + 1
+    return date(next_year, *_observed_birthday(month, day, next_year)).toordinal()
+
+
+def _observed_birthday(month: int, day: int, year: int) -> tuple[int, int]:
+    """Return the (month, day) a birthday falls on in year (Feb 29 -> Feb 28)."""
+    if month == 2 and day == 29 and not calendar.isleap(year):
+        return 2, 28
+    return month, day
@@ -5,7 +5,7 @@ from typing import Annotated
 
 from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
 from app.core.security import decode_access_token
@@ -13,7 +13,7 @@ from app.db import get_session
 from app.models import User
 
 # Database session dependency
-DBSession = Annotated[Session, Depends(get_session)]
+DBSession = Annotated[AsyncSession, Depends(get_session)]
 
 # OAuth2 scheme for JWT token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -43,7 +43,7 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    user = crud.get_user_by_id(session, user_id)
+    user = await crud.get_user_by_id(session, user_id)
     if user is None:
         raise credentials_exception
 
@@ -96,9 +96,17 @@ class PaginationParams:
             int,
             Query(ge=0, description="Number of items to skip"),
         ] = 0,
+        cursor: Annotated[
+            int | None,
+            Query(
+                ge=0,
+                description="Return items after this cursor (next_cursor of the previous page)",
+            ),
+        ] = None,
     ):
         self.limit = limit
         self.offset = offset
+        self.cursor = cursor
 
 
 Pagination = Annotated[PaginationParams, Depends()]
@@ -9,12 +9,12 @@ import redis.asyncio as redis
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_redoc_html
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
-from app.core.config import get_settings
+from app.core.config import SETTINGS as settings
 from app.routers import auth, contacts, users
 
 # Configure logging
@@ -24,8 +24,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-settings = get_settings()
-
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
@@ -98,6 +96,7 @@ A REST API for managing contacts with full authentication and authorization.
     """,
     version=settings.app_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url=None,
     openapi_url="/openapi.json",
@@ -108,14 +107,18 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 
+# ReDoc page depends only on static app metadata, so render it once
+_REDOC_HTML = get_redoc_html(
+    openapi_url=app.openapi_url or "/openapi.json",
+    title=f"{app.title} - ReDoc",
+    redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@2.1.3/bundles/redoc.standalone.js",
+).body
+
+
 @app.get("/redoc", include_in_schema=False)
 def redoc_html() -> HTMLResponse:
     """Custom ReDoc page with stable version."""
-    return get_redoc_html(
-        openapi_url=app.openapi_url or "/openapi.json",
-        title=f"{app.title} - ReDoc",
-        redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@2.1.3/bundles/redoc.standalone.js",
-    )
+    return HTMLResponse(content=_REDOC_HTML)
 
 
 # CORS middleware
@@ -139,7 +142,10 @@ def root() -> RedirectResponse:
     return RedirectResponse(url="/docs")
 
 
+_HEALTH = {"status": "healthy", "version": settings.app_version}
+
+
 @app.get("/health", tags=["health"])
 def health_check() -> dict[str, str]:
     """Health check endpoint."""
-    return {"status": "healthy", "version": settings.app_version}
+    return _HEALTH
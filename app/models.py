@@ -3,7 +3,7 @@
 
 from datetime import date
 
-from sqlalchemy import Boolean, Date, ForeignKey, Index, String, Text
+from sqlalchemy import Boolean, Date, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -60,7 +60,54 @@ class Contact(Base):
     # Relationships
     owner: Mapped["User"] = relationship("User", back_populates="contacts")
 
-    __table_args__ = (Index("ix_contacts_birthday_month_day", birthday),)
+    __table_args__ = (
+        Index("ix_contacts_birthday_month_day", birthday),
+        # Expression index backing the upcoming birthdays (month, day) lookup
+        Index(
+            "ix_contacts_birthday_md",
+            func.extract("month", birthday),
+            func.extract("day", birthday),
+        ),
+        # Case-insensitive email lookups (duplicate detection on create/update);
+        # text_pattern_ops also lets prefix searches use it
+        Index(
+            "ix_contacts_email_lower",
+            func.lower(email).label("email_lower"),
+            unique=True,
+            postgresql_ops={"email_lower": "text_pattern_ops"},
+        ),
+        # Prefix searches: lower(column) LIKE 'value%'
+        Index(
+            "ix_contacts_first_name_lower",
+            func.lower(first_name).label("first_name_lower"),
+            postgresql_ops={"first_name_lower": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_contacts_last_name_lower",
+            func.lower(last_name).label("last_name_lower"),
+            postgresql_ops={"last_name_lower": "text_pattern_ops"},
+        ),
+        # Trigram indexes so ILIKE '%q%' searches don't need a full scan
+        # (requires the pg_trgm extension)
+        Index(
+            "ix_contacts_first_name_trgm",
+            first_name,
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_last_name_trgm",
+            last_name,
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_email_trgm",
+            email,
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<Contact(id={self.id}, email='{self.email}')>"
@@ -41,7 +41,7 @@ async def register(
     Returns 409 if email is already registered.
     """
     # Check for existing user
-    existing = crud.get_user_by_email(session, data.email)
+    existing = await crud.get_user_by_email(session, data.email)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -49,7 +49,7 @@ async def register(
         )
 
     try:
-        user = crud.create_user(session, data)
+        user = await crud.create_user(session, data)
 
         # Get base URL for verification link
         base_url = str(request.base_url).rstrip("/")
@@ -59,7 +59,7 @@ async def register(
 
         return UserRead.model_validate(user)
     except IntegrityError as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered",
@@ -88,7 +88,7 @@ async def verify_email(token: str, session: DBSession) -> MessageResponse:
             detail="Invalid or expired verification token",
         )
 
-    user = crud.verify_user_email(session, email)
+    user = await crud.verify_user_email(session, email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -119,7 +119,7 @@ async def login(
 
     Use the returned token as: `Authorization: Bearer <access_token>`
     """
-    user = crud.authenticate_user(session, form_data.username, form_data.password)
+    user = await crud.authenticate_user(session, form_data.username, form_data.password)
 
     if not user:
         raise HTTPException(
@@ -165,7 +165,7 @@ async def resend_verification(
 
     Useful if the original email was lost or expired.
     """
-    user = crud.get_user_by_email(session, email)
+    user = await crud.get_user_by_email(session, email)
 
     if not user:
         # Don't reveal if email exists or not for security
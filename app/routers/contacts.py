@@ -28,7 +28,7 @@ router = APIRouter(prefix="/contacts", tags=["contacts"])
         409: {"description": "Contact with this email already exists"},
     },
 )
-def create_contact(
+async def create_contact(
     data: ContactCreate,
     session: DBSession,
     current_user: CurrentVerifiedUser,
@@ -44,7 +44,7 @@ def create_contact(
     - **notes**: Optional additional notes
     """
     # Check for existing email (globally unique)
-    existing = crud.get_contact_by_email(session, data.email)
+    existing = await crud.get_contact_by_email(session, data.email)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -52,10 +52,10 @@ def create_contact(
         )
 
     try:
-        contact = crud.create_contact(session, data, current_user.id)
+        contact = await crud.create_contact(session, data, current_user.id)
         return ContactRead.model_validate(contact)
     except IntegrityError as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Contact with this email already exists",
@@ -67,7 +67,7 @@ def create_contact(
     response_model=ContactListResponse,
     summary="List contacts with optional filters",
 )
-def list_contacts(
+async def list_contacts(
     session: DBSession,
     current_user: CurrentVerifiedUser,
     pagination: Pagination,
@@ -89,6 +89,12 @@ def list_contacts(
         str | None,
         Query(description="Filter by email (case-insensitive, partial match)"),
     ] = None,
+    prefix: Annotated[
+        bool,
+        Query(
+            description="Match from the start of the field instead of anywhere in it"
+        ),
+    ] = False,
 ) -> ContactListResponse:
     """
     List contacts for the authenticated user with optional filtering and pagination.
@@ -98,28 +104,36 @@ def list_contacts(
     - If individual fields (first_name, last_name, email) are provided without `q`:
       uses AND semantics
     - All searches are case-insensitive partial matches (ILIKE)
+    - Set `prefix=true` to match only values starting with the search term
 
     **Pagination:**
     - `limit`: Maximum items to return (1-100, default: 20)
     - `offset`: Number of items to skip (default: 0)
+    - `cursor`: Keyset cursor; pass `next_cursor` from the previous page to get
+      the next one. When set, `offset` is ignored and `total` is not computed
+    - `next_cursor` is null once the last page has been reached
 
     **Note:** Only returns contacts owned by the authenticated user.
     """
-    contacts, total = crud.list_contacts(
+    contacts, total = await crud.list_contacts(
         session,
         current_user.id,
         q=q,
         first_name=first_name,
         last_name=last_name,
         email=email,
+        prefix=prefix,
         limit=pagination.limit,
         offset=pagination.offset,
+        after_id=pagination.cursor,
+        include_total=pagination.cursor is None,
     )
     return ContactListResponse(
         items=[ContactRead.model_validate(c) for c in contacts],
         total=total,
         limit=pagination.limit,
         offset=pagination.offset,
+        next_cursor=contacts[-1].id if len(contacts) == pagination.limit else None,
     )
 
 
@@ -128,7 +142,7 @@ def list_contacts(
     response_model=list[ContactRead],
     summary="Get contacts with upcoming birthdays",
 )
-def get_upcoming_birthdays(
+async def get_upcoming_birthdays(
     session: DBSession,
     current_user: CurrentVerifiedUser,
     days: Annotated[
@@ -156,7 +170,7 @@ def get_upcoming_birthdays(
     Returns contacts ordered by their upcoming birthday date.
     **Note:** Only returns contacts owned by the authenticated user.
     """
-    contacts = crud.upcoming_birthdays(session, current_user.id, days=days)
+    contacts = await crud.upcoming_birthdays(session, current_user.id, days=days)
     return [ContactRead.model_validate(c) for c in contacts]
 
 
@@ -168,7 +182,7 @@ def get_upcoming_birthdays(
         404: {"description": "Contact not found"},
     },
 )
-def get_contact(
+async def get_contact(
     contact_id: int,
     session: DBSession,
     current_user: CurrentVerifiedUser,
@@ -178,7 +192,7 @@ def get_contact(
 
     Returns 404 if the contact doesn't exist or belongs to another user.
     """
-    contact = crud.get_contact(session, contact_id, current_user.id)
+    contact = await crud.get_contact(session, contact_id, current_user.id)
     if not contact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -196,7 +210,7 @@ def get_contact(
         409: {"description": "Email already exists"},
     },
 )
-def update_contact_full(
+async def update_contact_full(
     contact_id: int,
     data: ContactCreate,
     session: DBSession,
@@ -208,7 +222,7 @@ def update_contact_full(
     Returns 404 if the contact doesn't exist or belongs to another user.
     Returns 409 if the new email is already used by another contact.
     """
-    contact = crud.get_contact(session, contact_id, current_user.id)
+    contact = await crud.get_contact(session, contact_id, current_user.id)
     if not contact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -217,7 +231,7 @@ def update_contact_full(
 
     # Check email uniqueness if email is changing
     if data.email.lower() != contact.email.lower():
-        existing = crud.get_contact_by_email(session, data.email)
+        existing = await crud.get_contact_by_email(session, data.email)
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -226,10 +240,10 @@ def update_contact_full(
 
     update_data = ContactUpdate(**data.model_dump())
     try:
-        updated = crud.update_contact(session, contact, update_data)
+        updated = await crud.update_contact(session, contact, update_data)
         return ContactRead.model_validate(updated)
     except IntegrityError as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already exists",
@@ -245,7 +259,7 @@ def update_contact_full(
         409: {"description": "Email already exists"},
     },
 )
-def update_contact_partial(
+async def update_contact_partial(
     contact_id: int,
     data: ContactUpdate,
     session: DBSession,
@@ -257,7 +271,7 @@ def update_contact_partial(
     Returns 404 if the contact doesn't exist or belongs to another user.
     Returns 409 if the new email is already used by another contact.
     """
-    contact = crud.get_contact(session, contact_id, current_user.id)
+    contact = await crud.get_contact(session, contact_id, current_user.id)
     if not contact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -266,7 +280,7 @@ def update_contact_partial(
 
     # Check email uniqueness if email is changing
     if data.email is not None and data.email.lower() != contact.email.lower():
-        existing = crud.get_contact_by_email(session, data.email)
+        existing = await crud.get_contact_by_email(session, data.email)
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -274,10 +288,10 @@ def update_contact_partial(
             )
 
     try:
-        updated = crud.update_contact(session, contact, data)
+        updated = await crud.update_contact(session, contact, data)
         return ContactRead.model_validate(updated)
     except IntegrityError as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already exists",
@@ -292,7 +306,7 @@ def update_contact_partial(
         404: {"description": "Contact not found"},
     },
 )
-def delete_contact(
+async def delete_contact(
     contact_id: int,
     session: DBSession,
     current_user: CurrentVerifiedUser,
@@ -302,12 +316,12 @@ def delete_contact(
 
     Returns 404 if the contact doesn't exist or belongs to another user.
     """
-    contact = crud.get_contact(session, contact_id, current_user.id)
+    contact = await crud.get_contact(session, contact_id, current_user.id)
     if not contact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Contact with id {contact_id} not found",
         )
 
-    crud.delete_contact(session, contact)
+    await crud.delete_contact(session, contact)
     return MessageResponse(message=f"Contact with id {contact_id} deleted successfully")
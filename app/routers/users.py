@@ -6,12 +6,11 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from app import crud
-from app.core.config import get_settings
+from app.core.config import SETTINGS as settings
 from app.deps import CurrentVerifiedUser, DBSession
 from app.schemas import UserRead
 from app.services.cloud import upload_avatar
 
-settings = get_settings()
 limiter = Limiter(key_func=get_remote_address)
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -80,7 +79,7 @@ async def update_avatar(
 
     try:
         avatar_url = await upload_avatar(file, current_user.id)
-        updated_user = crud.update_user_avatar(session, current_user, avatar_url)
+        updated_user = await crud.update_user_avatar(session, current_user, avatar_url)
         return UserRead.model_validate(updated_user)
     except ValueError as e:
         raise HTTPException(
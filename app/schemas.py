@@ -3,12 +3,16 @@
 
 import re
 from datetime import date
+from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints
 
 # Phone number regex pattern
 PHONE_PATTERN = re.compile(r"^\+?[0-9()\-.\s]{7,20}$")
 
+# Phone number string, validated natively by pydantic-core (no Python validator)
+PhoneStr = Annotated[str, StringConstraints(pattern=PHONE_PATTERN.pattern)]
+
 
 # ============================================================================
 # User Schemas
@@ -68,21 +72,10 @@ class ContactBase(BaseModel):
     first_name: str = Field(..., min_length=1, max_length=255)
     last_name: str = Field(..., min_length=1, max_length=255)
     email: EmailStr = Field(..., max_length=255)
-    phone: str = Field(..., min_length=7, max_length=50)
+    phone: PhoneStr = Field(..., min_length=7, max_length=50)
     birthday: date
     notes: str | None = Field(None, max_length=5000)
 
-    @field_validator("phone")
-    @classmethod
-    def validate_phone(cls, v: str) -> str:
-        """Validate phone number format."""
-        if not PHONE_PATTERN.match(v):
-            raise ValueError(
-                "Phone must be 7-20 characters containing digits, "
-                "spaces, parentheses, dots, dashes, and optional leading +"
-            )
-        return v
-
 
 class ContactCreate(ContactBase):
     """Schema for creating a new contact."""
@@ -96,21 +89,10 @@ class ContactUpdate(BaseModel):
     first_name: str | None = Field(None, min_length=1, max_length=255)
     last_name: str | None = Field(None, min_length=1, max_length=255)
     email: EmailStr | None = Field(None, max_length=255)
-    phone: str | None = Field(None, min_length=7, max_length=50)
+    phone: PhoneStr | None = Field(None, min_length=7, max_length=50)
     birthday: date | None = None
     notes: str | None = Field(None, max_length=5000)
 
-    @field_validator("phone")
-    @classmethod
-    def validate_phone(cls, v: str | None) -> str | None:
-        """Validate phone number format if provided."""
-        if v is not None and not PHONE_PATTERN.match(v):
-            raise ValueError(
-                "Phone must be 7-20 characters containing digits, "
-                "spaces, parentheses, dots, dashes, and optional leading +"
-            )
-        return v
-
 
 class ContactRead(ContactBase):
     """Schema for reading contact data."""
@@ -125,9 +107,10 @@ class ContactListResponse(BaseModel):
     """Paginated list response for contacts."""
 
     items: list[ContactRead]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: int | None = None
 
 
 # ============================================================================
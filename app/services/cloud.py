@@ -8,10 +8,9 @@ import cloudinary
 import cloudinary.uploader
 from fastapi import UploadFile
 
-from app.core.config import get_settings
+from app.core.config import SETTINGS as settings
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 # Configure Cloudinary
 cloudinary.config(
@@ -6,11 +6,10 @@ from pathlib import Path
 
 from fastapi_mail import ConnectionConfig, FastMail, MessageSchema, MessageType
 
-from app.core.config import get_settings
+from app.core.config import SETTINGS as settings
 from app.core.security import create_email_verification_token
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 # Email configuration
 conf = ConnectionConfig(
@@ -0,0 +1,91 @@
+# tests/conftest.py
+"""Shared test database and client fixtures."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app import crud
+from app.db import get_session
+from app.main import app
+from app.models import Base
+from app.schemas import UserCreate
+
+# Use a throwaway SQLite file: the schema is managed through a sync engine once
+# per session, while the app and tests talk to it through aiosqlite. NullPool
+# keeps connections from being shared across per-test event loops.
+TEST_DB_DIR = Path(tempfile.mkdtemp(prefix="contacts-api-tests-"))
+TEST_DB_PATH = TEST_DB_DIR / "test.db"
+
+sync_engine = create_engine(f"sqlite:///{TEST_DB_PATH}")
+
+engine = create_async_engine(
+    f"sqlite+aiosqlite:///{TEST_DB_PATH}",
+    poolclass=NullPool,
+)
+
+TestingSessionLocal = async_sessionmaker(
+    bind=engine, autoflush=False, expire_on_commit=False
+)
+
+
+async def override_get_session():
+    """Override database session for testing."""
+    session = TestingSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+# Override the dependency
+app.dependency_overrides[get_session] = override_get_session
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    """Create the database schema once for the whole test session."""
+    Base.metadata.create_all(bind=sync_engine)
+    yield
+    Base.metadata.drop_all(bind=sync_engine)
+    sync_engine.dispose()
+    shutil.rmtree(TEST_DB_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="function")
+async def db_session(db_schema):
+    """Provide a database session and empty all tables after each test."""
+    async with TestingSessionLocal() as session:
+        yield session
+    with sync_engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
+@pytest.fixture(scope="function")
+async def client(db_session):
+    """Create a test client backed by the shared test database."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+async def user(db_session):
+    """Create a user to own the contacts under test."""
+    user = await crud.create_user(
+        db_session,
+        UserCreate(email="owner@example.com", password="password_123"),
+    )
+    await db_session.commit()
+    return user
@@ -0,0 +1,75 @@
+# tests/test_birthdays.py
+"""Tests for upcoming birthdays lookup."""
+
+from datetime import date
+
+from app import crud
+from app.schemas import ContactCreate, UserCreate
+
+
+async def add_contact(session, user_id, name, birthday):
+    """Helper to create a contact with the given birthday."""
+    return await crud.create_contact(
+        session,
+        ContactCreate(
+            first_name=name,
+            last_name="Test",
+            email=f"{name.lower()}@example.com",
+            phone="+1234567890",
+            birthday=birthday,
+        ),
+        user_id,
+    )
+
+
+class TestUpcomingBirthdays:
+    """Tests for crud.upcoming_birthdays."""
+
+    async def test_returns_contacts_within_window_ordered(self, db_session, user):
+        """Test that only birthdays inside the window are returned, soonest first."""
+        await add_contact(db_session, user.id, "Later", date(1990, 6, 20))
+        await add_contact(db_session, user.id, "Sooner", date(1985, 6, 16))
+        await add_contact(db_session, user.id, "Outside", date(1990, 7, 1))
+        await add_contact(db_session, user.id, "Passed", date(1990, 6, 14))
+
+        result = await crud.upcoming_birthdays(
+            db_session, user.id, days=7, today=date(2023, 6, 15)
+        )
+
+        assert [c.first_name for c in result] == ["Sooner", "Later"]
+
+    async def test_window_wraps_year_end(self, db_session, user):
+        """Test that a window crossing Dec 31 includes early January birthdays."""
+        await add_contact(db_session, user.id, "January", date(1990, 1, 2))
+        await add_contact(db_session, user.id, "December", date(1990, 12, 30))
+        await add_contact(db_session, user.id, "Outside", date(1990, 1, 10))
+
+        result = await crud.upcoming_birthdays(
+            db_session, user.id, days=7, today=date(2023, 12, 28)
+        )
+
+        assert [c.first_name for c in result] == ["December", "January"]
+
+    async def test_feb_29_birthday_on_non_leap_year(self, db_session, user):
+        """Test that Feb 29 birthdays are matched on Feb 28 in non-leap years."""
+        await add_contact(db_session, user.id, "Leap", date(2000, 2, 29))
+
+        result = await crud.upcoming_birthdays(
+            db_session, user.id, days=3, today=date(2023, 2, 26)
+        )
+
+        assert [c.first_name for c in result] == ["Leap"]
+
+    async def test_only_returns_own_contacts(self, db_session, user):
+        """Test that other users' contacts are not returned."""
+        other = await crud.create_user(
+            db_session,
+            UserCreate(email="other@example.com", password="password_123"),
+        )
+        await add_contact(db_session, other.id, "Foreign", date(1990, 6, 16))
+
+        result = await crud.upcoming_birthdays(
+            db_session, user.id, days=7, today=date(2023, 6, 15)
+        )
+
+        assert result == []
@@ -4,62 +4,8 @@
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app import crud
-from app.db import get_session
-from app.main import app
-from app.models import Base
-from app.schemas import ContactCreate, UserCreate
-
-# Use SQLite for tests (in-memory)
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def override_get_session():
-    """Override database session for testing."""
-    session = TestingSessionLocal()
-    try:
-        yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
-
-
-# Override the dependency
-app.dependency_overrides[get_session] = override_get_session
-
-
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh database session for each test."""
-    Base.metadata.create_all(bind=engine)
-    session = TestingSessionLocal()
-    yield session
-    session.close()
-    Base.metadata.drop_all(bind=engine)
-
-
-@pytest.fixture(scope="function")
-def client(db_session):
-    """Create a test client with fresh database."""
-    Base.metadata.create_all(bind=engine)
-    yield TestClient(app)
-    Base.metadata.drop_all(bind=engine)
 
 
 @pytest.fixture
@@ -95,19 +41,19 @@ def contact_data():
     }
 
 
-def create_verified_user_and_get_token(client, db_session, user_data):
+async def create_verified_user_and_get_token(client, db_session, user_data):
     """Helper to create a verified user and get their token."""
     with patch(
         "app.routers.auth.send_verification_email", new_callable=AsyncMock
     ):
-        client.post("/api/auth/register", json=user_data)
+        await client.post("/api/auth/register", json=user_data)
 
     # Verify user
-    crud.verify_user_email(db_session, user_data["email"])
-    db_session.commit()
+    await crud.verify_user_email(db_session, user_data["email"])
+    await db_session.commit()
 
     # Login
-    response = client.post(
+    response = await client.post(
         "/api/auth/login",
         data={
             "username": user_data["email"],
@@ -117,16 +63,35 @@ def create_verified_user_and_get_token(client, db_session, user_data):
     return response.json()["access_token"]
 
 
+async def create_contacts(client, headers, names):
+    """Helper to create contacts from (first_name, last_name, email) tuples."""
+    for first_name, last_name, email in names:
+        response = await client.post(
+            "/api/contacts",
+            json={
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+                "phone": "+1234567890",
+                "birthday": "1990-01-01",
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+
 class TestContactOwnership:
     """Tests for contact ownership and isolation."""
 
-    def test_user_can_create_contact(
+    async def test_user_can_create_contact(
         self, client, db_session, user_a_data, contact_data
     ):
         """Test that authenticated user can create a contact."""
-        token = create_verified_user_and_get_token(client, db_session, user_a_data)
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
 
-        response = client.post(
+        response = await client.post(
             "/api/contacts",
             json=contact_data,
             headers={"Authorization": f"Bearer {token}"},
@@ -138,14 +103,16 @@ class TestContactOwnership:
         assert data["email"] == contact_data["email"]
         assert "user_id" in data
 
-    def test_user_can_read_own_contact(
+    async def test_user_can_read_own_contact(
         self, client, db_session, user_a_data, contact_data
     ):
         """Test that user can read their own contact."""
-        token = create_verified_user_and_get_token(client, db_session, user_a_data)
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
 
         # Create contact
-        create_response = client.post(
+        create_response = await client.post(
             "/api/contacts",
             json=contact_data,
             headers={"Authorization": f"Bearer {token}"},
@@ -153,7 +120,7 @@ class TestContactOwnership:
         contact_id = create_response.json()["id"]
 
         # Read contact
-        response = client.get(
+        response = await client.get(
             f"/api/contacts/{contact_id}",
             headers={"Authorization": f"Bearer {token}"},
         )
@@ -161,13 +128,15 @@ class TestContactOwnership:
         assert response.status_code == 200
         assert response.json()["id"] == contact_id
 
-    def test_user_cannot_read_others_contact(
+    async def test_user_cannot_read_others_contact(
         self, client, db_session, user_a_data, user_b_data, contact_data
     ):
         """Test that user B cannot read user A's contact."""
         # Create user A and their contact
-        token_a = create_verified_user_and_get_token(client, db_session, user_a_data)
-        create_response = client.post(
+        token_a = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        create_response = await client.post(
             "/api/contacts",
             json=contact_data,
             headers={"Authorization": f"Bearer {token_a}"},
@@ -175,10 +144,12 @@ class TestContactOwnership:
         contact_id = create_response.json()["id"]
 
         # Create user B
-        token_b = create_verified_user_and_get_token(client, db_session, user_b_data)
+        token_b = await create_verified_user_and_get_token(
+            client, db_session, user_b_data
+        )
 
         # User B tries to read user A's contact
-        response = client.get(
+        response = await client.get(
             f"/api/contacts/{contact_id}",
             headers={"Authorization": f"Bearer {token_b}"},
         )
@@ -186,13 +157,15 @@ class TestContactOwnership:
         # Should return 404 (not 403, to not reveal existence)
         assert response.status_code == 404
 
-    def test_user_cannot_update_others_contact(
+    async def test_user_cannot_update_others_contact(
         self, client, db_session, user_a_data, user_b_data, contact_data
     ):
         """Test that user B cannot update user A's contact."""
         # Create user A and their contact
-        token_a = create_verified_user_and_get_token(client, db_session, user_a_data)
-        create_response = client.post(
+        token_a = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        create_response = await client.post(
             "/api/contacts",
             json=contact_data,
             headers={"Authorization": f"Bearer {token_a}"},
@@ -200,10 +173,12 @@ class TestContactOwnership:
         contact_id = create_response.json()["id"]
 
         # Create user B
-        token_b = create_verified_user_and_get_token(client, db_session, user_b_data)
+        token_b = await create_verified_user_and_get_token(
+            client, db_session, user_b_data
+        )
 
         # User B tries to update user A's contact
-        response = client.patch(
+        response = await client.patch(
             f"/api/contacts/{contact_id}",
             json={"notes": "Hacked!"},
             headers={"Authorization": f"Bearer {token_b}"},
@@ -211,13 +186,15 @@ class TestContactOwnership:
 
         assert response.status_code == 404
 
-    def test_user_cannot_delete_others_contact(
+    async def test_user_cannot_delete_others_contact(
         self, client, db_session, user_a_data, user_b_data, contact_data
     ):
         """Test that user B cannot delete user A's contact."""
         # Create user A and their contact
-        token_a = create_verified_user_and_get_token(client, db_session, user_a_data)
-        create_response = client.post(
+        token_a = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        create_response = await client.post(
             "/api/contacts",
             json=contact_data,
             headers={"Authorization": f"Bearer {token_a}"},
@@ -225,10 +202,12 @@ class TestContactOwnership:
         contact_id = create_response.json()["id"]
 
         # Create user B
-        token_b = create_verified_user_and_get_token(client, db_session, user_b_data)
+        token_b = await create_verified_user_and_get_token(
+            client, db_session, user_b_data
+        )
 
         # User B tries to delete user A's contact
-        response = client.delete(
+        response = await client.delete(
             f"/api/contacts/{contact_id}",
             headers={"Authorization": f"Bearer {token_b}"},
         )
@@ -236,19 +215,21 @@ class TestContactOwnership:
         assert response.status_code == 404
 
         # Verify contact still exists for user A
-        verify_response = client.get(
+        verify_response = await client.get(
             f"/api/contacts/{contact_id}",
             headers={"Authorization": f"Bearer {token_a}"},
         )
         assert verify_response.status_code == 200
 
-    def test_user_list_only_shows_own_contacts(
+    async def test_user_list_only_shows_own_contacts(
         self, client, db_session, user_a_data, user_b_data
     ):
         """Test that listing contacts only shows user's own contacts."""
         # Create user A with 2 contacts
-        token_a = create_verified_user_and_get_token(client, db_session, user_a_data)
-        client.post(
+        token_a = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        await client.post(
             "/api/contacts",
             json={
                 "first_name": "Contact",
@@ -259,7 +240,7 @@ class TestContactOwnership:
             },
             headers={"Authorization": f"Bearer {token_a}"},
         )
-        client.post(
+        await client.post(
             "/api/contacts",
             json={
                 "first_name": "Contact",
@@ -272,8 +253,10 @@ class TestContactOwnership:
         )
 
         # Create user B with 1 contact
-        token_b = create_verified_user_and_get_token(client, db_session, user_b_data)
-        client.post(
+        token_b = await create_verified_user_and_get_token(
+            client, db_session, user_b_data
+        )
+        await client.post(
             "/api/contacts",
             json={
                 "first_name": "Contact",
@@ -286,7 +269,7 @@ class TestContactOwnership:
         )
 
         # User A should see 2 contacts
-        response_a = client.get(
+        response_a = await client.get(
             "/api/contacts",
             headers={"Authorization": f"Bearer {token_a}"},
         )
@@ -294,7 +277,7 @@ class TestContactOwnership:
         assert response_a.json()["total"] == 2
 
         # User B should see 1 contact
-        response_b = client.get(
+        response_b = await client.get(
             "/api/contacts",
             headers={"Authorization": f"Bearer {token_b}"},
         )
@@ -306,14 +289,16 @@ class TestContactOwnership:
 class TestContactCRUD:
     """Tests for contact CRUD operations by owner."""
 
-    def test_owner_can_update_contact(
+    async def test_owner_can_update_contact(
         self, client, db_session, user_a_data, contact_data
     ):
         """Test that owner can update their contact."""
-        token = create_verified_user_and_get_token(client, db_session, user_a_data)
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
 
         # Create contact
-        create_response = client.post(
+        create_response = await client.post(
             "/api/contacts",
             json=contact_data,
             headers={"Authorization": f"Bearer {token}"},
@@ -321,7 +306,7 @@ class TestContactCRUD:
         contact_id = create_response.json()["id"]
 
         # Update contact
-        response = client.patch(
+        response = await client.patch(
             f"/api/contacts/{contact_id}",
             json={"notes": "Updated notes"},
             headers={"Authorization": f"Bearer {token}"},
@@ -330,14 +315,16 @@ class TestContactCRUD:
         assert response.status_code == 200
         assert response.json()["notes"] == "Updated notes"
 
-    def test_owner_can_delete_contact(
+    async def test_owner_can_delete_contact(
         self, client, db_session, user_a_data, contact_data
     ):
         """Test that owner can delete their contact."""
-        token = create_verified_user_and_get_token(client, db_session, user_a_data)
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
 
         # Create contact
-        create_response = client.post(
+        create_response = await client.post(
             "/api/contacts",
             json=contact_data,
             headers={"Authorization": f"Bearer {token}"},
@@ -345,7 +332,7 @@ class TestContactCRUD:
         contact_id = create_response.json()["id"]
 
         # Delete contact
-        response = client.delete(
+        response = await client.delete(
             f"/api/contacts/{contact_id}",
             headers={"Authorization": f"Bearer {token}"},
         )
@@ -353,20 +340,57 @@ class TestContactCRUD:
         assert response.status_code == 200
 
         # Verify contact is deleted
-        get_response = client.get(
+        get_response = await client.get(
             f"/api/contacts/{contact_id}",
             headers={"Authorization": f"Bearer {token}"},
         )
         assert get_response.status_code == 404
 
-    def test_contact_requires_authentication(self, client):
+    async def test_list_contacts_cursor_pagination(
+        self, client, db_session, user_a_data
+    ):
+        """Test that next_cursor walks through all contacts page by page."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for i in range(3):
+            await client.post(
+                "/api/contacts",
+                json={
+                    "first_name": "Contact",
+                    "last_name": f"Number{i}",
+                    "email": f"contact{i}@example.com",
+                    "phone": "+1234567890",
+                    "birthday": "1990-01-01",
+                },
+                headers=headers,
+            )
+
+        response = await client.get("/api/contacts?limit=2", headers=headers)
+        first_page = response.json()
+        assert len(first_page["items"]) == 2
+        assert first_page["total"] == 3
+        assert first_page["next_cursor"] == first_page["items"][-1]["id"]
+
+        response = await client.get(
+            f"/api/contacts?limit=2&cursor={first_page['next_cursor']}",
+            headers=headers,
+        )
+        second_page = response.json()
+        assert [c["last_name"] for c in second_page["items"]] == ["Number2"]
+        assert second_page["total"] is None
+        assert second_page["next_cursor"] is None
+
+    async def test_contact_requires_authentication(self, client):
         """Test that contact endpoints require authentication."""
         # Try to list contacts without token
-        response = client.get("/api/contacts")
+        response = await client.get("/api/contacts")
         assert response.status_code == 401
 
         # Try to create contact without token
-        response = client.post(
+        response = await client.post(
             "/api/contacts",
             json={
                 "first_name": "Test",
@@ -379,16 +403,183 @@ class TestContactCRUD:
         assert response.status_code == 401
 
 
+class TestContactSearch:
+    """Tests for filtering the contact list."""
+
+    async def test_q_matches_any_field(self, client, db_session, user_a_data):
+        """Test that q matches first name, last name or email."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        await create_contacts(
+            client,
+            headers,
+            [
+                ("John", "Doe", "jd@example.com"),
+                ("Mary", "Johnson", "mary@example.com"),
+                ("Alice", "Smith", "alice.john@example.com"),
+                ("Bob", "Brown", "bob@example.com"),
+            ],
+        )
+
+        response = await client.get("/api/contacts?q=john", headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["first_name"] for c in data["items"]] == ["John", "Mary", "Alice"]
+        assert data["total"] == 3
+
+    async def test_field_filters_are_combined(self, client, db_session, user_a_data):
+        """Test that several field filters must all match."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        await create_contacts(
+            client,
+            headers,
+            [
+                ("John", "Doe", "john.doe@example.com"),
+                ("John", "Smith", "john.smith@example.com"),
+                ("Jane", "Doe", "jane.doe@example.com"),
+            ],
+        )
+
+        response = await client.get(
+            "/api/contacts?first_name=John&last_name=Doe", headers=headers
+        )
+        data = response.json()
+        assert [c["email"] for c in data["items"]] == ["john.doe@example.com"]
+        assert data["total"] == 1
+
+    async def test_search_is_case_insensitive(self, client, db_session, user_a_data):
+        """Test that filters ignore case."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        await create_contacts(
+            client,
+            headers,
+            [
+                ("John", "Doe", "john.doe@example.com"),
+                ("Jane", "Roe", "jane.roe@example.com"),
+            ],
+        )
+
+        response = await client.get("/api/contacts?last_name=DOE", headers=headers)
+        assert [c["first_name"] for c in response.json()["items"]] == ["John"]
+
+        response = await client.get("/api/contacts?q=jAnE", headers=headers)
+        assert [c["first_name"] for c in response.json()["items"]] == ["Jane"]
+
+        response = await client.get(
+            "/api/contacts?email=JOHN.DOE@EXAMPLE.COM", headers=headers
+        )
+        assert [c["first_name"] for c in response.json()["items"]] == ["John"]
+
+    async def test_page_past_end_reports_total(self, client, db_session, user_a_data):
+        """Test that an empty page past the end still reports the match count."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        await create_contacts(
+            client,
+            headers,
+            [
+                ("John", "Doe", "john.doe@example.com"),
+                ("Jane", "Doe", "jane.doe@example.com"),
+                ("Bob", "Brown", "bob@example.com"),
+            ],
+        )
+
+        response = await client.get(
+            "/api/contacts?last_name=Doe&offset=10", headers=headers
+        )
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] == 2
+        assert data["next_cursor"] is None
+
+    async def test_filtered_cursor_pagination(self, client, db_session, user_a_data):
+        """Test that next_cursor pages through filtered results only."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        await create_contacts(
+            client,
+            headers,
+            [
+                ("Ann", "Doe", "ann.doe@example.com"),
+                ("Bob", "Brown", "bob@example.com"),
+                ("Cid", "Doe", "cid.doe@example.com"),
+                ("Dan", "Doe", "dan.doe@example.com"),
+            ],
+        )
+
+        response = await client.get("/api/contacts?q=doe&limit=2", headers=headers)
+        first_page = response.json()
+        assert [c["first_name"] for c in first_page["items"]] == ["Ann", "Cid"]
+        assert first_page["total"] == 3
+        assert first_page["next_cursor"] == first_page["items"][-1]["id"]
+
+        response = await client.get(
+            f"/api/contacts?q=doe&limit=2&cursor={first_page['next_cursor']}",
+            headers=headers,
+        )
+        second_page = response.json()
+        assert [c["first_name"] for c in second_page["items"]] == ["Dan"]
+        assert second_page["total"] is None
+        assert second_page["next_cursor"] is None
+
+    async def test_prefix_mode_matches_start_only(
+        self, client, db_session, user_a_data
+    ):
+        """Test that prefix=true only matches values starting with the term."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        await create_contacts(
+            client,
+            headers,
+            [
+                ("John", "Doe", "jd@example.com"),
+                ("MJohnson", "Roe", "mj@example.com"),
+            ],
+        )
+
+        response = await client.get("/api/contacts?first_name=Joh", headers=headers)
+        assert [c["first_name"] for c in response.json()["items"]] == [
+            "John",
+            "MJohnson",
+        ]
+
+        response = await client.get(
+            "/api/contacts?first_name=Joh&prefix=true", headers=headers
+        )
+        assert [c["first_name"] for c in response.json()["items"]] == ["John"]
+
+        response = await client.get("/api/contacts?q=JOH&prefix=true", headers=headers)
+        data = response.json()
+        assert [c["first_name"] for c in data["items"]] == ["John"]
+        assert data["total"] == 1
+
+
 class TestGlobalEmailUniqueness:
     """Tests for globally unique contact emails."""
 
-    def test_different_users_cannot_create_contacts_with_same_email(
+    async def test_different_users_cannot_create_contacts_with_same_email(
         self, client, db_session, user_a_data, user_b_data, contact_data
     ):
         """Test that contact emails are globally unique."""
         # User A creates contact
-        token_a = create_verified_user_and_get_token(client, db_session, user_a_data)
-        response_a = client.post(
+        token_a = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        response_a = await client.post(
             "/api/contacts",
             json=contact_data,
             headers={"Authorization": f"Bearer {token_a}"},
@@ -396,11 +587,127 @@ class TestGlobalEmailUniqueness:
         assert response_a.status_code == 201
 
         # User B tries to create contact with same email
-        token_b = create_verified_user_and_get_token(client, db_session, user_b_data)
-        response_b = client.post(
+        token_b = await create_verified_user_and_get_token(
+            client, db_session, user_b_data
+        )
+        response_b = await client.post(
             "/api/contacts",
             json=contact_data,
             headers={"Authorization": f"Bearer {token_b}"},
         )
         assert response_b.status_code == 409
 
+    async def test_email_uniqueness_is_case_insensitive(
+        self, client, db_session, user_a_data, contact_data
+    ):
+        """Test that emails are stored lowercased and compared case-insensitively."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.post(
+            "/api/contacts",
+            json={**contact_data, "email": "John.Doe@Example.com"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        assert response.json()["email"] == "john.doe@example.com"
+
+        response = await client.post(
+            "/api/contacts", json=contact_data, headers=headers
+        )
+        assert response.status_code == 409
+
+    async def test_update_lowercases_email(
+        self, client, db_session, user_a_data, contact_data
+    ):
+        """Test that a mixed-case email set via PATCH is stored lowercased."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+
+        create_response = await client.post(
+            "/api/contacts", json=contact_data, headers=headers
+        )
+        contact_id = create_response.json()["id"]
+
+        response = await client.patch(
+            f"/api/contacts/{contact_id}",
+            json={"email": "Jane.Roe@Example.com"},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["email"] == "jane.roe@example.com"
+
+        stored = await crud.get_contact_by_email(db_session, "jane.roe@example.com")
+        assert stored is not None
+        assert stored.email == "jane.roe@example.com"
+
+
+class TestPhoneValidation:
+    """Tests for contact phone number validation."""
+
+    async def test_create_rejects_invalid_phone(
+        self, client, db_session, user_a_data, contact_data
+    ):
+        """Test that a phone with non-numeric characters is rejected on create."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.post(
+            "/api/contacts",
+            json={**contact_data, "phone": "abcdefgh"},
+            headers=headers,
+        )
+        assert response.status_code == 422
+
+    async def test_create_accepts_formatted_phone(
+        self, client, db_session, user_a_data, contact_data
+    ):
+        """Test that spaces, parentheses, dashes and dots are allowed."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.post(
+            "/api/contacts",
+            json={**contact_data, "phone": "+1 (234) 567-89.0"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        assert response.json()["phone"] == "+1 (234) 567-89.0"
+
+    async def test_update_validates_phone_only_when_given(
+        self, client, db_session, user_a_data, contact_data
+    ):
+        """Test that PATCH rejects an invalid phone but does not require one."""
+        token = await create_verified_user_and_get_token(
+            client, db_session, user_a_data
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+
+        create_response = await client.post(
+            "/api/contacts", json=contact_data, headers=headers
+        )
+        contact_id = create_response.json()["id"]
+
+        response = await client.patch(
+            f"/api/contacts/{contact_id}",
+            json={"phone": "abcdefgh"},
+            headers=headers,
+        )
+        assert response.status_code == 422
+
+        response = await client.patch(
+            f"/api/contacts/{contact_id}",
+            json={"notes": "Updated notes"},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["notes"] == "Updated notes"
+        assert response.json()["phone"] == contact_data["phone"]
@@ -0,0 +1,45 @@
+# tests/test_contacts_crud.py
+"""Tests for contact CRUD helpers used outside the HTTP layer."""
+
+from datetime import date
+
+from app import crud
+from app.schemas import ContactCreate
+
+
+class TestCreateContactsBulk:
+    """Tests for crud.create_contacts_bulk."""
+
+    async def test_inserts_rows_in_input_order(self, db_session, user):
+        """Test that a multi-row insert returns contacts in input order."""
+        data_list = [
+            ContactCreate(
+                first_name=name,
+                last_name="Bulk",
+                email=f"{name}@Example.COM",
+                phone="+1234567890",
+                birthday=date(1990, 1, 1),
+            )
+            for name in ("Charlie", "Alice", "Bob")
+        ]
+
+        contacts = await crud.create_contacts_bulk(db_session, data_list, user.id)
+        await db_session.commit()
+
+        assert [c.first_name for c in contacts] == ["Charlie", "Alice", "Bob"]
+        assert all(c.id is not None for c in contacts)
+        assert len({c.id for c in contacts}) == 3
+        assert all(c.user_id == user.id for c in contacts)
+        assert [c.email for c in contacts] == [
+            "charlie@example.com",
+            "alice@example.com",
+            "bob@example.com",
+        ]
+
+        stored, total = await crud.list_contacts(db_session, user.id)
+        assert total == 3
+        assert {c.email for c in stored} == {c.email for c in contacts}
+
+    async def test_empty_list_returns_empty(self, db_session, user):
+        """Test that an empty input inserts nothing."""
+        assert await crud.create_contacts_bulk(db_session, [], user.id) == []